@@ -0,0 +1,75 @@
+#     Copyright 2024. ThingsBoard
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+
+from datetime import datetime, timezone
+
+from asyncua.ua import DataValue, Variant, VariantType, LocalizedText, NodeId, StatusCode
+
+from tests.unit.BaseUnitTest import BaseUnitTest
+from thingsboard_gateway.connectors.opcua.opcua_uplink_converter import OpcUaUplinkConverter
+
+
+class OpcUaUplinkConverterTests(BaseUnitTest):
+    CONFIG = {'device_name': 'Test Device', 'device_type': 'default'}
+
+    def setUp(self):
+        self.converter = OpcUaUplinkConverter(self.CONFIG, self.log)
+
+    def test_primitive_values(self):
+        configs = [{'section': 'timeseries', 'key': 'temperature'}, {'section': 'attributes', 'key': 'model'}]
+        values = [DataValue(Variant(21.5, VariantType.Double)), DataValue(Variant('M-100', VariantType.String))]
+        self.converter.convert(configs, values)
+        self.assertListEqual(self.converter.data['telemetry'], [{'temperature': 21.5}])
+        self.assertListEqual(self.converter.data['attributes'], [{'model': 'M-100'}])
+
+    def test_single_value(self):
+        self.converter.convert({'section': 'timeseries', 'key': 'counter'}, DataValue(Variant(5, VariantType.Int32)))
+        self.assertListEqual(self.converter.data['telemetry'], [{'counter': 5}])
+
+    def test_list_value(self):
+        self.converter.convert({'section': 'timeseries', 'key': 'array'},
+                               DataValue(Variant([1, 2, 3], VariantType.Int32)))
+        self.assertListEqual(self.converter.data['telemetry'], [{'array': ['1', '2', '3']}])
+
+    def test_variant_type_values(self):
+        dt = datetime(2024, 1, 1, 12, 0, 0)
+        cases = [
+            (Variant(LocalizedText('text'), VariantType.LocalizedText), 'text'),
+            (Variant(dt, VariantType.DateTime), dt.replace(tzinfo=timezone.utc).isoformat()),
+            (Variant(NodeId(1000, 2), VariantType.NodeId), 'ns=2;i=1000'),
+            (Variant(b'\x01\xff', VariantType.ByteString), '01ff'),
+            (Variant(StatusCode(0), VariantType.StatusCode), 'Good'),
+        ]
+        for (variant, expected) in cases:
+            with self.subTest(variant_type=variant.VariantType):
+                self.converter.clear_data()
+                self.converter.convert({'section': 'timeseries', 'key': 'value'}, DataValue(variant))
+                self.assertListEqual(self.converter.data['telemetry'], [{'value': expected}])
+
+    def test_unsupported_variant_type_value(self):
+        # asyncua unwraps nested Variant values, DataValue has no handler and is kept as an object
+        data = DataValue(Variant(1, VariantType.Int32))
+        with self.assertLogs(self.log, level='WARNING') as logs:
+            self.converter.convert({'section': 'timeseries', 'key': 'value'},
+                                   DataValue(Variant(data, VariantType.DataValue)))
+        self.assertListEqual(self.converter.data['telemetry'], [{'value': str(data)}])
+        self.assertIn('Unsupported data type', logs.output[0])
+
+    def test_get_data(self):
+        self.assertIsNone(self.converter.get_data())
+        self.converter.convert({'section': 'attributes', 'key': 'model'},
+                               DataValue(Variant('M-100', VariantType.String)))
+        data = self.converter.get_data()
+        self.assertEqual(data[0]['deviceName'], self.CONFIG['device_name'])
+        self.assertListEqual(data[0]['attributes'], [{'model': 'M-100'}])
@@ -0,0 +1,196 @@
+#     Copyright 2024. ThingsBoard
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+
+from threading import Event
+from time import sleep, monotonic
+from unittest.mock import MagicMock, patch
+
+from tests.unit.BaseUnitTest import BaseUnitTest
+from thingsboard_gateway.tb_utility.tb_logger import TbLogger
+
+
+class TbLoggerTests(BaseUnitTest):
+    ERRORS_PROCESSING_PERIOD = .05
+
+    def setUp(self):
+        self._loggers = []
+        self._gateways = []
+        self._patchers = [
+            patch.object(TbLogger, 'ERRORS_PROCESSING_PERIOD', self.ERRORS_PROCESSING_PERIOD),
+            patch.object(TbLogger, 'SEND_ERRORS_PERIOD_NS', 0),
+            patch.object(TbLogger, 'ALL_ERRORS_COUNT', 0),
+            patch.object(TbLogger, 'IS_ALL_ERRORS_COUNT_RESET', True),
+            patch.object(TbLogger, '_pending_error_counts', {}),
+        ]
+        for patcher in self._patchers:
+            patcher.start()
+
+    def tearDown(self):
+        for gateway in self._gateways:
+            gateway.tb_client_ready.set()
+        for log in self._loggers:
+            log.stop()
+        self.assertTrue(self._wait_for(lambda: TbLogger._errors_processing_thread is None))
+        for patcher in self._patchers:
+            patcher.stop()
+
+    @staticmethod
+    def _wait_for(condition, timeout=2):
+        deadline = monotonic() + timeout
+        while not condition():
+            if monotonic() > deadline:
+                return False
+            sleep(.01)
+
+        return True
+
+    def _create_gateway(self, ready=True, connected=True):
+        gateway = MagicMock()
+        gateway.tb_client_ready = Event()
+        if ready:
+            gateway.tb_client_ready.set()
+        gateway.tb_client.is_connected.return_value = connected
+        self._gateways.append(gateway)
+        return gateway
+
+    def _create_logger(self, name, gateway, wait_for_init=True):
+        log = TbLogger(name, gateway=gateway)
+        self._loggers.append(log)
+        if wait_for_init:
+            self.assertTrue(self._wait_for(lambda: not log._is_on_init_state))
+        return log
+
+    def test_errors_processing_thread_starts_on_first_error(self):
+        log = self._create_logger('first_error', self._create_gateway())
+        self.assertIsNone(TbLogger._errors_processing_thread)
+
+        log.error('Test error')
+
+        self.assertIsNotNone(TbLogger._errors_processing_thread)
+        self.assertTrue(TbLogger._errors_processing_thread.is_alive())
+        self.assertIn(log, TbLogger._errors_processing_loggers)
+
+    def test_errors_processing_thread_exits_after_last_logger_stopped(self):
+        gateway = self._create_gateway()
+        first_log = self._create_logger('first', gateway)
+        second_log = self._create_logger('second', gateway)
+        first_log.error('Test error')
+        second_log.error('Test error')
+        thread = TbLogger._errors_processing_thread
+
+        first_log.stop()
+        sleep(self.ERRORS_PROCESSING_PERIOD * 3)
+        self.assertIs(TbLogger._errors_processing_thread, thread)
+        self.assertTrue(thread.is_alive())
+
+        second_log.stop()
+        self.assertTrue(self._wait_for(lambda: TbLogger._errors_processing_thread is None))
+        thread.join(1)
+        self.assertFalse(thread.is_alive())
+
+    def test_errors_processing_thread_restarts_on_new_registration(self):
+        gateway = self._create_gateway()
+        first_log = self._create_logger('first', gateway)
+        first_log.error('Test error')
+        first_thread = TbLogger._errors_processing_thread
+        first_log.stop()
+        self.assertTrue(self._wait_for(lambda: TbLogger._errors_processing_thread is None))
+
+        second_log = self._create_logger('second', gateway)
+        second_log.error('Test error')
+
+        self.assertIsNotNone(TbLogger._errors_processing_thread)
+        self.assertIsNot(TbLogger._errors_processing_thread, first_thread)
+        self.assertTrue(TbLogger._errors_processing_thread.is_alive())
+
+    def test_stop_sends_zero_count_of_logger_without_errors(self):
+        gateway = self._create_gateway()
+        log = self._create_logger('no_errors', gateway)
+        self.assertIsNone(TbLogger._errors_processing_thread)
+
+        log.stop()
+
+        self.assertTrue(self._wait_for(lambda: gateway.tb_client.client.send_telemetry.called))
+        gateway.tb_client.client.send_telemetry.assert_called_once_with(
+            {'no_errors_ERRORS_COUNT': 0, 'ALL_ERRORS_COUNT': 0})
+        self.assertTrue(self._wait_for(lambda: TbLogger._errors_processing_thread is None))
+        self.assertDictEqual(TbLogger._pending_error_counts, {})
+
+    def test_init_state_loggers_are_skipped(self):
+        init_log = self._create_logger('init_state', self._create_gateway(ready=False), wait_for_init=False)
+        gateway = self._create_gateway()
+        ready_log = self._create_logger('ready', gateway)
+
+        init_log.error('Test error')
+        ready_log.error('Test error')
+
+        self.assertTrue(self._wait_for(lambda: gateway.tb_client.client.send_telemetry.called))
+        self.assertTrue(init_log._is_on_init_state)
+        self.assertEqual(init_log._TbLogger__previous_number_of_errors, -1)
+        self.assertEqual(gateway.tb_client.client.send_telemetry.call_args.args[0]['ready_ERRORS_COUNT'], 1)
+
+    def test_startup_reset_waits_for_tb_client_ready(self):
+        gateway = self._create_gateway(ready=False)
+        with patch.object(TbLogger, 'IS_ALL_ERRORS_COUNT_RESET', False):
+            log = self._create_logger('startup', gateway, wait_for_init=False)
+            sleep(self.ERRORS_PROCESSING_PERIOD * 3)
+            self.assertTrue(log._is_on_init_state)
+            gateway.tb_client.client.send_telemetry.assert_not_called()
+
+            gateway.tb_client_ready.set()
+
+            self.assertTrue(self._wait_for(lambda: not log._is_on_init_state))
+            gateway.tb_client.client.send_telemetry.assert_called_once_with(
+                {'startup_ERRORS_COUNT': 0, 'ALL_ERRORS_COUNT': 0}, quality_of_service=0)
+            self.assertTrue(TbLogger.IS_ALL_ERRORS_COUNT_RESET)
+
+    def test_wait_for_tb_client_falls_back_to_polling(self):
+        class Gateway:
+            pass
+
+        gateway = Gateway()
+        log = self._create_logger('polling', gateway, wait_for_init=False)
+        sleep(self.ERRORS_PROCESSING_PERIOD * 3)
+        self.assertTrue(log._is_on_init_state)
+
+        gateway.tb_client = MagicMock()
+
+        # the polling backoff is capped at 1 second
+        self.assertTrue(self._wait_for(lambda: not log._is_on_init_state, timeout=1.5))
+
+    def test_error_counts_sent_in_one_message(self):
+        gateway = self._create_gateway()
+        first_log = self._create_logger('first', gateway)
+        second_log = self._create_logger('second', gateway)
+
+        # a longer period so both errors are processed on the same tick
+        with patch.object(TbLogger, 'ERRORS_PROCESSING_PERIOD', .3):
+            first_log.error('Test error')
+            second_log.error('Test error')
+
+            self.assertTrue(self._wait_for(lambda: gateway.tb_client.client.send_telemetry.called))
+            sleep(.1)
+
+        gateway.tb_client.client.send_telemetry.assert_called_once_with(
+            {'first_ERRORS_COUNT': 1, 'second_ERRORS_COUNT': 1, 'ALL_ERRORS_COUNT': 2})
+
+    def test_error_counts_not_sent_while_disconnected(self):
+        gateway = self._create_gateway(connected=False)
+        log = self._create_logger('disconnected', gateway)
+
+        log.error('Test error')
+        sleep(self.ERRORS_PROCESSING_PERIOD * 5)
+
+        gateway.tb_client.is_connected.assert_called()
+        gateway.tb_client.client.send_telemetry.assert_not_called()
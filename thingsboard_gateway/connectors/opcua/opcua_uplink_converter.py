@@ -12,34 +12,73 @@
 #     See the License for the specific language governing permissions and
 #     limitations under the License.
 
-from time import time
 from datetime import timezone
 
 from thingsboard_gateway.connectors.opcua.opcua_converter import OpcUaConverter
-from asyncua.ua.uatypes import LocalizedText, VariantType
+from asyncua.ua.uatypes import VariantType
 
 DATA_TYPES = {
     'attributes': 'attributes',
     'timeseries': 'telemetry'
 }
 
+PRIMITIVE_TYPES = (int, float, str, bool, dict)
+
+
+def _convert_datetime(data):
+    if data.tzinfo is None:
+        data = data.replace(tzinfo=timezone.utc)
+    return data.isoformat()
+
+
+def _convert_null(_):
+    return None
+
+
+def _default_to_string(data):
+    if hasattr(data, 'to_string'):
+        return data.to_string()
+
+    return str(data)
+
+
+def _to_string(data):
+    return data.to_string()
+
+
+def _decode_xml_element(data):
+    return data.decode('utf-8')
+
+
+# Handlers indexed by VariantType value, None means the type is not supported and processed as a string
+VARIANT_TYPE_HANDLERS = [None] * (max(VariantType) + 1)
+VARIANT_TYPE_HANDLERS[VariantType.LocalizedText] = lambda data: data.Text
+VARIANT_TYPE_HANDLERS[VariantType.ExtensionObject] = str
+VARIANT_TYPE_HANDLERS[VariantType.DateTime] = _convert_datetime
+VARIANT_TYPE_HANDLERS[VariantType.StatusCode] = lambda data: data.name
+VARIANT_TYPE_HANDLERS[VariantType.QualifiedName] = _to_string
+VARIANT_TYPE_HANDLERS[VariantType.NodeId] = _to_string
+VARIANT_TYPE_HANDLERS[VariantType.ExpandedNodeId] = _to_string
+VARIANT_TYPE_HANDLERS[VariantType.ByteString] = bytes.hex
+VARIANT_TYPE_HANDLERS[VariantType.XmlElement] = _decode_xml_element
+VARIANT_TYPE_HANDLERS[VariantType.Guid] = str
+VARIANT_TYPE_HANDLERS[VariantType.DiagnosticInfo] = _to_string
+VARIANT_TYPE_HANDLERS[VariantType.Null] = _convert_null
+
 
 class OpcUaUplinkConverter(OpcUaConverter):
     def __init__(self, config, logger):
         self._log = logger
         self.__config = config
-        self.data = {
-            'deviceName': self.__config['device_name'],
-            'deviceType': self.__config['device_type'],
-            'attributes': [],
-            'telemetry': [],
-        }
+        self.__device_name = config['device_name']
+        self.__device_type = config['device_type']
+        self.clear_data()
         self._last_node_timestamp = 0
 
     def clear_data(self):
         self.data = {
-            'deviceName': self.__config['device_name'],
-            'deviceType': self.__config['device_type'],
+            'deviceName': self.__device_name,
+            'deviceType': self.__device_type,
             'attributes': [],
             'telemetry': [],
         }
@@ -68,40 +107,17 @@ class OpcUaUplinkConverter(OpcUaConverter):
             if not val or val is None:
                 continue
 
-            data = val.Value.Value
+            variant = val.Value
+            data = variant.Value
 
             if isinstance(data, list):
                 data = [str(item) for item in data]
-            elif data is not None and not isinstance(data, (int, float, str, bool, dict, type(None))):
-                if isinstance(data, LocalizedText):
-                    data = data.Text
-                elif val.Value.VariantType == VariantType.ExtensionObject:
-                    data = str(data)
-                elif val.Value.VariantType == VariantType.DateTime:
-                    if data.tzinfo is None:
-                        data = data.replace(tzinfo=timezone.utc)
-                    data = data.isoformat()
-                elif val.Value.VariantType == VariantType.StatusCode:
-                    data = data.name
-                elif (val.Value.VariantType == VariantType.QualifiedName
-                      or val.Value.VariantType == VariantType.NodeId
-                      or val.Value.VariantType == VariantType.ExpandedNodeId):
-                    data = data.to_string()
-                elif val.Value.VariantType == VariantType.ByteString:
-                    data = data.hex()
-                elif val.Value.VariantType == VariantType.XmlElement:
-                    data = data.decode('utf-8')
-                elif val.Value.VariantType == VariantType.Guid:
-                    data = str(data)
-                elif val.Value.VariantType == VariantType.DiagnosticInfo:
-                    data = data.to_string()
-                elif val.Value.VariantType == VariantType.Null:
-                    data = None
+            elif data is not None and not isinstance(data, PRIMITIVE_TYPES):
+                handler = VARIANT_TYPE_HANDLERS[variant.VariantType]
+                if handler is not None:
+                    data = handler(data)
                 else:
-                    self._log.warning(f"Unsupported data type: {val.Value.VariantType}, will be processed as a string.")
-                    if hasattr(data, 'to_string'):
-                        data = data.to_string()
-                    else:
-                        data = str(data)
+                    self._log.warning('Unsupported data type: %s, will be processed as a string.', variant.VariantType)
+                    data = _default_to_string(data)
 
             self.data[DATA_TYPES[config['section']]].append({config['key']: data})
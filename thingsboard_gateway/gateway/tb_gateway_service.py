@@ -25,7 +25,7 @@ from random import choice
 from signal import signal, SIGINT
 from string import ascii_lowercase, hexdigits
 from sys import argv, executable, getsizeof
-from threading import RLock, Thread, main_thread, current_thread
+from threading import RLock, Thread, Event, main_thread, current_thread
 from time import sleep, time, monotonic
 from copy import deepcopy
 
@@ -191,6 +191,8 @@ class TBGatewayService:
             log.exception(e)
         self.tb_client.register_service_subscription_callback(self.subscribe_to_required_topics)
         self.tb_client.connect()
+        # connect() returns once the client is connected, loggers waiting for the client can use it from now on
+        self.tb_client_ready.set()
         if self.stopped:
             return
         if logging_error is not None:
@@ -296,6 +298,7 @@ class TBGatewayService:
         self.__grpc_manager = None
         self.__remote_configurator = None
         self.tb_client = None
+        self.tb_client_ready = Event()
         self.__requested_config_after_connect = False
         self.__rpc_reply_sent = False
         self.__subscribed_to_rpc_topics = False
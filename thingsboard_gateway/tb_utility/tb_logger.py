@@ -13,8 +13,12 @@
 #     limitations under the License.
 
 import logging
-from time import sleep, monotonic
-from threading import Thread
+from time import sleep, monotonic_ns
+from threading import Thread, Lock
+from weakref import WeakSet
+
+# Log levels resolved by init_logger, keyed by the configured level name
+_LEVEL_CACHE = {}
 
 
 def init_logger(gateway, name, level, enable_remote_logging=False):
@@ -38,7 +42,9 @@ def init_logger(gateway, name, level, enable_remote_logging=False):
 
     log_level_conf = level
     if log_level_conf:
-        log_level = logging.getLevelName(log_level_conf)
+        log_level = _LEVEL_CACHE.get(log_level_conf)
+        if log_level is None:
+            log_level = _LEVEL_CACHE[log_level_conf] = logging.getLevelName(log_level_conf)
 
         try:
             log.setLevel(log_level)
@@ -49,10 +55,26 @@ def init_logger(gateway, name, level, enable_remote_logging=False):
 
 
 class TbLogger(logging.Logger):
+    # logging.Logger instances still have a __dict__, slots only cover the attributes added by TbLogger
+    __slots__ = ('_gateway', '_stopped', '__previous_number_of_errors', '__previous_errors_sent_time', 'errors',
+                 'attr_name', '_is_on_init_state', '_send_errors_thread', '_start_time',
+                 '_is_errors_processing_registered')
+
     ALL_ERRORS_COUNT = 0
     IS_ALL_ERRORS_COUNT_RESET = False
     RESET_ERRORS_PERIOD = 60
     SEND_ERRORS_PERIOD = 5
+    RESET_ERRORS_PERIOD_NS = RESET_ERRORS_PERIOD * 1_000_000_000
+    SEND_ERRORS_PERIOD_NS = SEND_ERRORS_PERIOD * 1_000_000_000
+    ERRORS_PROCESSING_PERIOD = 1
+
+    # Loggers that had errors share one errors processing thread, it exits when there are no registered loggers left
+    _errors_processing_loggers = WeakSet()
+    _errors_processing_lock = Lock()
+    _errors_processing_thread = None
+    # Error counters waiting to be sent, grouped by gateway and sent as one telemetry message per gateway
+    _pending_error_counts = {}
+    _error_counts_sent_time = 0
 
     def __init__(self, name, gateway=None, level=logging.NOTSET):
         super(TbLogger, self).__init__(name=name, level=level)
@@ -61,7 +83,7 @@ class TbLogger(logging.Logger):
         self._gateway = gateway
         self._stopped = False
         self.__previous_number_of_errors = -1
-        self.__previous_errors_sent_time = monotonic()
+        self.__previous_errors_sent_time = monotonic_ns()
         self.errors = 0
         self.attr_name = self.name + '_ERRORS_COUNT'
         self._is_on_init_state = True
@@ -69,10 +91,9 @@ class TbLogger(logging.Logger):
             self._send_errors_thread = Thread(target=self._send_errors, name='[LOGGER] Send Errors Thread', daemon=True)
             self._send_errors_thread.start()
 
-        self._start_time = monotonic()
-        self._reset_errors_thread = Thread(target=self._processing_errors, name='[LOGGER] Reset Errors Thread',
-                                           daemon=True)
-        self._reset_errors_thread.start()
+        self._start_time = monotonic_ns()
+        # the logger is registered for errors processing on its first error
+        self._is_errors_processing_registered = False
 
     def reset(self):
         """
@@ -85,6 +106,7 @@ class TbLogger(logging.Logger):
     def stop(self):
         self.reset()
         self._stopped = True
+        TbLogger._unregister_errors_processing(self)
 
     @property
     def gateway(self):
@@ -95,14 +117,7 @@ class TbLogger(logging.Logger):
         self._gateway = gateway
 
     def _send_errors(self):
-        is_tb_client = False
-
-        while not self._gateway:
-            sleep(1)
-
-        while not is_tb_client:
-            is_tb_client = hasattr(self._gateway, 'tb_client')
-            sleep(1)
+        self._wait_for_tb_client()
 
         if not TbLogger.IS_ALL_ERRORS_COUNT_RESET and self._gateway.tb_client is not None and self._gateway.tb_client.is_connected():
             self._gateway.tb_client.client.send_telemetry(
@@ -110,17 +125,94 @@ class TbLogger(logging.Logger):
             TbLogger.IS_ALL_ERRORS_COUNT_RESET = True
         self._is_on_init_state = False
 
-    def _processing_errors(self):
-        while not self._stopped:
-            if (self.__previous_number_of_errors != self.errors
-                    and monotonic() - self.__previous_errors_sent_time >= TbLogger.SEND_ERRORS_PERIOD):
-                self.__previous_number_of_errors = self.errors
-                self._send_error_count()
-            elif monotonic() - self._start_time >= TbLogger.RESET_ERRORS_PERIOD:
-                self.reset()
-                self._start_time = monotonic()
+    def _wait_for_tb_client(self):
+        tb_client_ready = getattr(self._gateway, 'tb_client_ready', None)
+        if tb_client_ready is not None:
+            tb_client_ready.wait()
+            return
+
+        attempt = 0
+        while not hasattr(self._gateway, 'tb_client'):
+            sleep(min(.05 * 2 ** attempt, 1))
+            attempt += 1
+
+    @classmethod
+    def _register_errors_processing(cls, logger):
+        with cls._errors_processing_lock:
+            cls._errors_processing_loggers.add(logger)
+            cls._start_errors_processing_thread()
+
+    @classmethod
+    def _start_errors_processing_thread(cls):
+        # must be called with _errors_processing_lock acquired
+        if cls._errors_processing_thread is None:
+            cls._errors_processing_thread = Thread(target=cls._processing_loggers_errors,
+                                                   name='[LOGGER] Reset Errors Thread', daemon=True)
+            cls._errors_processing_thread.start()
+
+    @classmethod
+    def _unregister_errors_processing(cls, logger):
+        with cls._errors_processing_lock:
+            cls._errors_processing_loggers.discard(logger)
+
+    @classmethod
+    def _processing_loggers_errors(cls):
+        while True:
+            sleep(cls.ERRORS_PROCESSING_PERIOD)
+
+            with cls._errors_processing_lock:
+                stopped = not cls._errors_processing_loggers
+                if stopped:
+                    cls._errors_processing_thread = None
+
+            if not stopped:
+                cls._process_loggers_errors()
+
+            if stopped or monotonic_ns() - cls._error_counts_sent_time >= cls.SEND_ERRORS_PERIOD_NS:
+                cls._send_pending_error_counts()
+
+            if stopped:
+                return
+
+    @classmethod
+    def _process_loggers_errors(cls):
+        with cls._errors_processing_lock:
+            loggers = tuple(cls._errors_processing_loggers)
+
+        for logger in loggers:
+            # the logger is not able to send errors yet, keep its counters until it is
+            if logger._is_on_init_state:
+                continue
+
+            try:
+                logger._processing_errors()
+            except Exception as e:
+                logging.getLogger('service').debug('Failed to process errors of logger %s', logger.name, exc_info=e)
+
+    @classmethod
+    def _send_pending_error_counts(cls):
+        with cls._errors_processing_lock:
+            pending_error_counts = cls._pending_error_counts
+            cls._pending_error_counts = {}
+
+        cls._error_counts_sent_time = monotonic_ns()
+        for (gateway, error_counts) in pending_error_counts.items():
+            try:
+                tb_client = gateway.tb_client
+                if tb_client is not None and tb_client.is_connected():
+                    error_counts['ALL_ERRORS_COUNT'] = cls.ALL_ERRORS_COUNT
+                    tb_client.client.send_telemetry(error_counts)
+            except Exception as e:
+                logging.getLogger('service').debug('Failed to send errors count', exc_info=e)
 
-            sleep(1)
+    def _processing_errors(self):
+        if (self.__previous_number_of_errors != self.errors
+                and monotonic_ns() - self.__previous_errors_sent_time >= TbLogger.SEND_ERRORS_PERIOD_NS):
+            self.__previous_number_of_errors = self.errors
+            self._send_error_count()
+        elif monotonic_ns() - self._start_time >= TbLogger.RESET_ERRORS_PERIOD_NS:
+            self.reset()
+            self._start_time = monotonic_ns()
 
     def error(self, msg, *args, **kwargs):
         kwargs['stacklevel'] = 2
@@ -139,15 +231,24 @@ class TbLogger(logging.Logger):
         TbLogger.ALL_ERRORS_COUNT += 1
         self.errors += 1
 
+        if not self._is_errors_processing_registered and not self._stopped:
+            self._is_errors_processing_registered = True
+            TbLogger._register_errors_processing(self)
+
     def _send_error_count(self, error_attr_name=None):
-        while self._is_on_init_state:
-            sleep(.2)
+        # the gateway client is not connected yet, the logger's own counter is sent by the errors processing thread
+        # once the logger leaves the init state, counters passed with a custom attr_name are dropped
+        if self._is_on_init_state:
+            return
 
-        if self._gateway and hasattr(self._gateway, 'tb_client'):
+        # leaving the init state means the gateway has already got its tb_client
+        if self._gateway is not None:
             if error_attr_name:
                 error_attr_name = error_attr_name + '_ERRORS_COUNT'
             else:
                 error_attr_name = self.attr_name
-            if self._gateway.tb_client is not None and self._gateway.tb_client.is_connected():
-                self._gateway.tb_client.client.send_telemetry(
-                    {error_attr_name: self.errors, 'ALL_ERRORS_COUNT': TbLogger.ALL_ERRORS_COUNT})
+
+            with TbLogger._errors_processing_lock:
+                TbLogger._pending_error_counts.setdefault(self._gateway, {})[error_attr_name] = self.errors
+                # loggers without errors are not registered, the thread still has to flush their counters
+                TbLogger._start_errors_processing_thread()